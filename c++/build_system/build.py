@@ -2,38 +2,140 @@
 from genericpath import isfile
 import sys
 import os
-import glob
 import platform
 import subprocess
 import click
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 EXECUTABLE_EXTENSION = ".exe" if platform.system() == "Windows" else ""
 
+def parse_depfile(text: str) -> list:
+    # Only the first rule matters: -MMD writes "<object>: <source> <headers...>" and -MP appends
+    # empty rules for each header. Lines are continued with a trailing backslash, spaces inside
+    # paths are escaped with a backslash (as is "#"), and "$" is written as "$$".
+    rule = text.replace("\\\r\n", " ").replace("\\\n", " ").split("\n", 1)[0]
+    words, word, i = [], "", 0
+
+    while i < len(rule):
+        char, next_char = rule[i], rule[i + 1:i + 2]
+
+        if (char == "\\" and next_char in (" ", "#")) or (char == "$" and next_char == "$"):
+            word += next_char
+            i += 2
+            continue
+
+        if char in (" ", "\t", "\r"):
+            if word != "":
+                words.append(word)
+            word = ""
+        else:
+            word += char
+
+        i += 1
+
+    if word != "":
+        words.append(word)
+
+    # Everything after the target (the first word ending in ':') is a dependency
+    for index, word in enumerate(words):
+        if word.endswith(":"):
+            return words[index + 1:]
+
+    return []
+
+def get_compile_call_args(std: str, cpp_file: str, object_path: str) -> list:
+    return ["g++", "-std=" + std, "-fdiagnostics-color=always", "-g", "-MMD", "-MP", "-c", "-o", object_path, cpp_file]
+
+def get_stamp_path(object_path: str) -> str:
+    return os.path.splitext(object_path)[0] + ".cmd"
+
+def is_up_to_date(object_path: str, depfile_path: str, compile_call_args: list) -> bool:
+    stamp_path = get_stamp_path(object_path)
+    if not os.path.isfile(object_path) or not os.path.isfile(depfile_path) or not os.path.isfile(stamp_path):
+        return False
+
+    # An object built with different flags (e.g. another --std) is stale
+    with open(stamp_path) as f:
+        if f.read() != "\n".join(compile_call_args):
+            return False
+
+    with open(depfile_path) as f:
+        dependencies = parse_depfile(f.read())
+
+    object_mtime = os.path.getmtime(object_path)
+    return len(dependencies) != 0 and all(os.path.isfile(dependency) and os.path.getmtime(dependency) <= object_mtime for dependency in dependencies)
+
+def compile_object(compile_call_args: list, object_path: str) -> int:
+    stamp_path = get_stamp_path(object_path)
+    if os.path.isfile(stamp_path):
+        os.remove(stamp_path)
+
+    print(f"[CMD] {' '.join(compile_call_args)}")
+    return_code = subprocess.run(compile_call_args).returncode
+
+    # Record the command only once it has produced the object
+    if return_code == 0:
+        with open(stamp_path, "w") as f:
+            f.write("\n".join(compile_call_args))
+
+    return return_code
+
 @click.command()
 @click.option("--std", type=str, default="c++2a", help="The C++ standard to use.")
+@click.option("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="The number of files to compile in parallel.")
 @click.argument("library", type=str, required=True, nargs=1)
-def build(std: str, library: str):
+def build(std: str, jobs: int, library: str):
     print(f"Building {library}...")
     assert os.path.isdir(library), f"The directory '{library}/' does not exist!"
 
-    cpp_files = [file for file in glob.glob(f"{library}/*.cpp")]
+    cpp_files = [entry.path for entry in os.scandir(library) if entry.is_file() and entry.name.endswith(".cpp") and not entry.name.startswith(".")]
     assert len(cpp_files) != 0, f"There are no .cpp files in {library}/"
 
     print("\nThe following cpp files will be included in the build:")
     for file in cpp_files:
         print("\t" + file)
 
-    # Create bin directory that houses executable
-    if not os.path.isdir(f"{library}/bin/"):
-        os.mkdir(f"{library}/bin/")
+    # Create bin directory that houses executable and the obj directory that houses object and dependency files
+    os.makedirs(f"{library}/bin/obj/", exist_ok=True)
+
+    # Compile each out of date cpp file to an object file in parallel
+    object_paths = [f"{library}/bin/obj/{os.path.splitext(os.path.basename(file))[0]}.o" for file in cpp_files]
+    compile_jobs = [(get_compile_call_args(std, file, object_path), object_path) for file, object_path in zip(cpp_files, object_paths)]
+    stale = [(args, object_path) for args, object_path in compile_jobs if not is_up_to_date(object_path, os.path.splitext(object_path)[0] + ".d", args)]
+
+    print(f"\nCompiling {len(stale)} of {len(cpp_files)} cpp files...")
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        return_codes = list(executor.map(lambda job: compile_object(*job), stale))
+
+    if any(code != 0 for code in return_codes):
+        print("\nCompilation failed!")
+        sys.exit(1)
 
-    # Run g++
+    # Link the object files, passed through a response file to stay under command line length limits
+    # Relinking is also needed when the object list changed, e.g. after a cpp file was deleted
     output_path = f"{library}/bin/main" + EXECUTABLE_EXTENSION
-    build_call_args = ["g++", "-std=" + std, "-fdiagnostics-color=always", "-g", "-o", output_path] + cpp_files
-    
-    print(f"\n[CMD] {' '.join(build_call_args)}")
-    subprocess.call(build_call_args)
+    response_file_path = f"{library}/bin/obj/objects.rsp"
+    response_file_content = "\n".join([f"\"{path.replace(os.sep, '/')}\"" for path in object_paths])
+
+    previous_response_file_content = None
+    if os.path.isfile(response_file_path):
+        with open(response_file_path) as f:
+            previous_response_file_content = f.read()
+
+    if len(stale) == 0 and response_file_content == previous_response_file_content and os.path.isfile(output_path) and all(os.path.getmtime(path) <= os.path.getmtime(output_path) for path in object_paths):
+        print(f"\n{output_path} is up to date.")
+        return
+
+    with open(response_file_path, "w") as f:
+        f.write(response_file_content)
+
+    link_call_args = ["g++", "-fdiagnostics-color=always", "-g", "-o", output_path, "@" + response_file_path]
+
+    print(f"\n[CMD] {' '.join(link_call_args)}")
+    if subprocess.run(link_call_args).returncode != 0:
+        print("\nLinking failed!")
+        sys.exit(1)
 
 @click.command()
 @click.option("--type", type=click.Choice(['major', 'minor', 'patch'], case_sensitive=False), required=True)
@@ -54,10 +156,9 @@ def run(library: str):
     executable_path = os.path.abspath(f"bin/main" + EXECUTABLE_EXTENSION)
     assert os.path.isfile(executable_path), f"The executable '{executable_path}' does not exist!"
 
-    cmd = f"./{os.path.basename(os.path.dirname(executable_path))}/{os.path.basename(executable_path)}"
-    print(f"[CMD] {cmd}\n")
+    print(f"[CMD] {executable_path}\n")
 
-    subprocess.call(cmd)
+    subprocess.run([executable_path])
     os.chdir(old_dir)
 
 @click.command()
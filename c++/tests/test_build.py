@@ -0,0 +1,59 @@
+import os
+import shutil
+import pytest
+from click.testing import CliRunner
+from build_system import build
+
+requires_gpp = pytest.mark.skipif(shutil.which("g++") is None, reason="g++ is not installed")
+
+def write(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+def test_parse_depfile():
+    text = "bin/obj/main.o: main.cpp a.h \\\n my\\ dir/b.h c\\#d.h cost$$.h\n\na.h:\n\nmy\\ dir/b.h:\n"
+    assert build.parse_depfile(text) == ["main.cpp", "a.h", "my dir/b.h", "c#d.h", "cost$.h"]
+
+def test_parse_depfile_drive_letter_target():
+    assert build.parse_depfile("C:/lib/bin/obj/main.o: C:/lib/main.cpp\n") == ["C:/lib/main.cpp"]
+
+def test_is_up_to_date(tmp_path):
+    source, header, object_path, depfile_path = [str(tmp_path / name) for name in ["main.cpp", "my a.h", "main.o", "main.d"]]
+    args = build.get_compile_call_args("c++2a", source, object_path)
+
+    write(source, "")
+    write(header, "")
+    write(object_path, "")
+    write(depfile_path, f"{object_path}: {source} {header.replace(' ', chr(92) + ' ')}\n")
+    assert not build.is_up_to_date(object_path, depfile_path, args), "missing command stamp"
+
+    write(build.get_stamp_path(object_path), "\n".join(args))
+    os.utime(source, (0, 0))
+    os.utime(header, (0, 0))
+    assert build.is_up_to_date(object_path, depfile_path, args)
+    assert not build.is_up_to_date(object_path, depfile_path, build.get_compile_call_args("c++11", source, object_path))
+
+    os.utime(header, None)
+    os.utime(object_path, (1, 1))
+    assert not build.is_up_to_date(object_path, depfile_path, args), "header is newer than the object"
+
+@requires_gpp
+def test_build_relinks_on_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("lib")
+    write("lib/main.cpp", "int f();\nint main() { return f(); }\n")
+    write("lib/a.cpp", "int f() { return 0; }\n")
+
+    runner = CliRunner()
+    assert runner.invoke(build.build, ["lib"]).exit_code == 0
+    assert "up to date" in runner.invoke(build.build, ["lib"]).output
+
+    # A different standard recompiles every object
+    result = runner.invoke(build.build, ["--std", "c++17", "lib"])
+    assert "Compiling 2 of 2" in result.output and "up to date" not in result.output
+
+    # Deleting a source relinks without its object, which now fails on the missing symbol
+    os.remove("lib/a.cpp")
+    result = runner.invoke(build.build, ["--std", "c++17", "lib"])
+    assert "up to date" not in result.output
+    assert result.exit_code == 1
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
-from io import StringIO
+import bisect
+import functools
+import random
 import re
-from typing import Any, Callable, Dict, Generic, List, NamedTuple, Optional, Pattern, Tuple, TypeVar, Union, cast
+from typing import Any, Callable, Dict, FrozenSet, Generic, List, NamedTuple, Optional, Pattern, Tuple, TypeVar, Union, cast
 from dataclasses import dataclass
 
 @dataclass
 class Position:
+    __slots__ = ('line', 'column')
+
     line: int
     column: int
 
@@ -13,56 +17,47 @@ class Position:
         return f"({self.line}, {self.column})"
 
 class StringStream:
+    __slots__ = ('__string', '__offset', '__size', '__lineStarts')
+
+    NEWLINE_REGEX = re.compile("\n")
+
     def __init__(self, string: str) -> None:
-        self.__stream = StringIO(string)
+        self.__string = string
+        self.__offset = 0
         self.__size = len(string)
 
         # Get line starting offsets
-        self.__lineStarts = [0]
-
-        for line in self.__stream.readlines()[:-1]:
-            self.__lineStarts.append(self.__lineStarts[-1] + len(line))
-
-        self.__stream.seek(0) # reset stream to start
+        self.__lineStarts = [0] + [match.end() for match in StringStream.NEWLINE_REGEX.finditer(string)]
 
     def Peek(self) -> str:
-        start = self.__stream.tell()
-        value = self.__stream.read(1)
-        self.__stream.seek(start)
-        return value
+        return self.__string[self.__offset:self.__offset + 1]
 
     def Get(self) -> str:
-        return self.__stream.read(1)
+        value = self.__string[self.__offset:self.__offset + 1]
+        self.__offset += len(value)
+        return value
 
     def PeekRemainder(self) -> str:
-        start = self.__stream.tell()
-        value = self.__stream.read()
-        self.__stream.seek(start)
-        return value
+        return self.__string[self.__offset:]
+
+    def GetString(self) -> str:
+        return self.__string
 
     def Ignore(self, amt: int) -> None:
-        self.__stream.read(amt)
+        self.__offset = min(self.__offset + amt, self.__size)
 
     def GetOffset(self) -> int:
-        return self.__stream.tell()
+        return self.__offset
 
     def SetOffset(self, offset: int) -> None:
-        self.__stream.seek(max(0, min(offset, self.__size)))
+        self.__offset = max(0, min(offset, self.__size))
 
     def IsEOS(self) -> bool:
-        return self.GetOffset() == self.__size
+        return self.__offset >= self.__size
 
     def GetPosition(self) -> Position:
-        line, closestLineStart, offset = 0, 0, self.GetOffset()
-
-        for lineStart in self.__lineStarts:
-            if lineStart > offset:
-                break
-
-            closestLineStart = lineStart
-            line += 1
-
-        return Position(line, offset - closestLineStart + 1)
+        line = bisect.bisect_right(self.__lineStarts, self.__offset)
+        return Position(line, self.__offset - self.__lineStarts[line - 1] + 1)
 
     def SetPosition(self, pos: Position) -> None:
         if pos.line > len(self.__lineStarts) or pos.line == 0 or pos.column == 0:
@@ -76,7 +71,13 @@ class StringStream:
 
         self.SetOffset(lineStart + pos.column - 1)
 
+@functools.lru_cache(maxsize=512)
+def _compile(regex: str) -> re.Pattern:
+    return re.compile(regex)
+
 class Lexer:
+    __slots__ = ('__patternEOS', '__patternUnknown', '__patterns', '__combined')
+
     PatternID = str
     Action = Union[None, Callable[['Lexer', str], str]]
     Pattern = NamedTuple('Pattern', [('id', PatternID), ('regex', re.Pattern), ('action', Action)])
@@ -86,20 +87,55 @@ class Lexer:
     UNKNOWN_PATTERN_ID = "<UNKNOWN>"
 
     def __init__(self, onEOS: Action = None, onUnknown: Action = None) -> None:
-        self.__patternEOS = Lexer.Pattern(Lexer.EOS_PATTERN_ID, re.compile(""), onEOS)
-        self.__patternUnknown = Lexer.Pattern(Lexer.UNKNOWN_PATTERN_ID, re.compile(""), onUnknown)
+        self.__patternEOS = Lexer.Pattern(Lexer.EOS_PATTERN_ID, re.compile(""), Lexer.__CheckAction(onEOS))
+        self.__patternUnknown = Lexer.Pattern(Lexer.UNKNOWN_PATTERN_ID, re.compile(""), Lexer.__CheckAction(onUnknown))
         self.__patterns : List[Lexer.Pattern] = []
+        self.__combined : Optional[Tuple[Optional[re.Pattern], List[Tuple[int, Lexer.Pattern]]]] = None
 
     def GetPatternIDs(self) -> List[PatternID]:
-        return [pattern.id for pattern in self.__patterns] + [Lexer.EOS_PATTERN_ID(), Lexer.UNKNOWN_PATTERN_ID()]
+        return [pattern.id for pattern in self.__patterns] + [Lexer.EOS_PATTERN_ID, Lexer.UNKNOWN_PATTERN_ID]
 
     def AddPattern(self, regex: str, action: Action = None, id: Optional[PatternID] = None) -> PatternID:
         patternID = f"<Pattern: {len(self.__patterns)}>" if id is None else id
         assert patternID not in self.GetPatternIDs(), f"Pattern with id '{patternID}' already exists!"
 
-        self.__patterns.append(Lexer.Pattern(patternID, re.compile(f"^({regex})"), action))
+        self.__patterns.append(Lexer.Pattern(patternID, _compile(f"({regex})"), Lexer.__CheckAction(action)))
+        self.__combined = None
         return self.__patterns[-1].id
 
+    def __CheckAction(action: Action) -> Action:
+        # Validate action results once here rather than on every lexed token; skipped entirely under `python -O`
+        if action is None or not __debug__:
+            return action
+
+        def checked(lexer: 'Lexer', value: str) -> str:
+            result = action(lexer, value)
+            assert isinstance(result, str), "Matching Pattern's action did not return a string!"
+            return result
+
+        return checked
+
+    def __GetCombined(self) -> Tuple[Optional[re.Pattern], List[Tuple[int, 'Lexer.Pattern']]]:
+        # Every pattern is wrapped in an optional lookahead so that a single match reports
+        # the span of each pattern at the current offset, from which the longest is chosen.
+        # Patterns with their own groups could clash on names or have their backreferences
+        # renumbered once combined, so those lexers match each pattern separately instead.
+        if self.__combined is None:
+            regex : Optional[re.Pattern] = None
+
+            if all(pattern.regex.groups == 1 for pattern in self.__patterns):
+                try:
+                    regex = _compile("".join([f"(?:(?=(?P<_{i}>{pattern.regex.pattern})))?" for i, pattern in enumerate(self.__patterns)]))
+                except re.error:
+                    regex = None
+
+            if regex is None:
+                self.__combined = (None, list(enumerate(self.__patterns)))
+            else:
+                self.__combined = (regex, [(regex.groupindex[f"_{i}"], pattern) for i, pattern in enumerate(self.__patterns)])
+
+        return self.__combined
+
     def Lex(self, stream: StringStream) -> Token:
         matchingPattern: Optional[Lexer.Pattern] = None
         streamPos = stream.GetPosition()
@@ -108,60 +144,78 @@ class Lexer:
         if stream.IsEOS():
             matchingPattern = self.__patternEOS
         else:
-            string = stream.PeekRemainder()
+            string, offset = stream.GetString(), stream.GetOffset()
+            regex, groups = self.__GetCombined()
+
+            if regex is not None:
+                match = regex.match(string, offset)
+                spans = [match.span(group) for group, _ in groups]
+            else:
+                matches = [pattern.regex.match(string, offset) for _, pattern in groups]
+                spans = [(-1, -1) if match is None else match.span() for match in matches]
+
             greatestPatternMatchLength = 0
 
-            for pattern in self.__patterns:
-                searchResult = pattern.regex.search(string)
-                if searchResult is None:
+            for (start, end), (_, pattern) in zip(spans, groups):
+                if start == -1:
                     continue
-                
-                match = searchResult[0]
-                if matchingPattern is None or len(match) > greatestPatternMatchLength:
+
+                if matchingPattern is None or end - start > greatestPatternMatchLength:
                     matchingPattern = pattern
-                    matchValue = match
-                    greatestPatternMatchLength = len(match)
+                    greatestPatternMatchLength = end - start
 
             if matchingPattern is None:
                 matchingPattern = self.__patternUnknown
                 matchValue = stream.Peek()
+            else:
+                matchValue = string[offset:offset + greatestPatternMatchLength]
 
         stream.Ignore(len(matchValue))
 
         value = matchValue if matchingPattern.action is None else matchingPattern.action(self, matchValue)
-        assert isinstance(value, str), "Matching Pattern's action did not return a string!"
 
         return Lexer.Token(matchingPattern.id, streamPos, value)
 
 class TokenStream:
-    def __init__(self, lexer: Lexer, string: str, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
+    __slots__ = ('__lexer', '__stream', '__offset', '__tokens', '__ignores', '__memo', '__memoRate', '__memoRandom')
+
+    MemoKey = Tuple[int, int]
+    MemoEntry = Union[Tuple['Parser.Result', int], 'Parser.Error']
+
+    def __init__(self, lexer: Lexer, string: str, ignores: Optional[List[Lexer.PatternID]] = None, memoRate: float = 0.0) -> None:
         self.__lexer = lexer
         self.__stream = StringStream(string)
         self.__offset : int = 0
         self.__tokens : List[Lexer.Token] = []
-        self.__ignores = ignores if ignores is not None else []
+        self.__ignores = frozenset(ignores) if ignores is not None else frozenset()
+        self.__memo : Dict[TokenStream.MemoKey, TokenStream.MemoEntry] = {}
+        self.__memoRate = memoRate
+        self.__memoRandom = random.Random() # Own generator so sampling never disturbs the global random state
 
         assert Lexer.EOS_PATTERN_ID not in self.__ignores, f"{Lexer.EOS_PATTERN_ID} cannot be ignored!"
+        assert 0.0 <= memoRate <= 1.0, f"memoRate={memoRate} must be between 0 and 1"
 
-    def Get(self) -> Lexer.Token:
-        while True:
-            while len(self.__tokens) <= self.__offset and not self.IsEOS():
-                self.__tokens.append(self.__lexer.Lex(self.__stream))
+    def __Fill(self) -> Lexer.Token:
+        # Ignored tokens are dropped as they are lexed so they never occupy the buffer
+        while len(self.__tokens) <= self.__offset:
+            token = self.__lexer.Lex(self.__stream)
 
-            token = self.__tokens[self.__offset]
-            self.__offset = len(self.__tokens) - 1 if self.IsEOS() else self.__offset + 1
+            if token.patternID not in self.__ignores:
+                self.__tokens.append(token)
 
-            if token.patternID in self.__ignores:
-                continue
+        return self.__tokens[self.__offset]
+
+    def Get(self) -> Lexer.Token:
+        token = self.__Fill()
 
-            return token
+        if token.patternID != Lexer.EOS_PATTERN_ID:
+            self.__offset += 1
 
-    def Peek(self) -> Lexer.Token:
-        initOffset = self.__offset
-        token = self.Get()
-        self.__offset = initOffset
         return token
 
+    def Peek(self) -> Lexer.Token:
+        return self.__Fill()
+
     def GetOffset(self) -> int:
         return self.__offset
 
@@ -169,19 +223,32 @@ class TokenStream:
         self.__offset = max(0, min(offset, len(self.__tokens) - 1))
 
     def IsEOS(self) -> bool:
-        return len(self.__tokens) != 0 and self.__tokens[self.__offset].patternID == Lexer.EOS_PATTERN_ID
+        return self.__offset < len(self.__tokens) and self.__tokens[self.__offset].patternID == Lexer.EOS_PATTERN_ID
 
     def GetPosition(self) -> Position:
         return self.Peek().position
 
+    def IsMemoizing(self) -> bool:
+        return self.__memoRate != 0.0
+
+    def Recall(self, key: MemoKey) -> Optional[MemoEntry]:
+        return self.__memo.get(key)
+
+    def Memoize(self, key: MemoKey, entry: MemoEntry) -> None:
+        # Only a fraction of entries are kept when memoRate < 1, trading re-parses for memo upkeep
+        if self.__memoRate == 1.0 or self.__memoRandom.random() < self.__memoRate:
+            self.__memo[key] = entry
+
 class Parser(ABC):
+    __slots__ = ('__name', '__ignores', '__transformer')
+
     Result = NamedTuple('Result', [('position', Position), ('value', Any)])
     Transformer = Callable[[Any], Any]
 
     def __init__(self, name: str, transformer: Optional[Transformer] = None, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
         super().__init__()
         self.__name = name
-        self.__ignores = ignores if ignores is not None else []
+        self.__ignores = frozenset(ignores) if ignores is not None else frozenset()
         self.__transformer = (lambda value: value) if transformer is None else transformer
 
         assert Lexer.EOS_PATTERN_ID not in self.__ignores, f"{Lexer.EOS_PATTERN_ID} cannot be ignored!"
@@ -189,42 +256,88 @@ class Parser(ABC):
     def GetName(self) -> str:
         return self.__name
 
+    def _skipIgnores(self, stream: TokenStream) -> Lexer.Token:
+        token = stream.Peek()
+
+        while token.patternID in self.__ignores:
+            stream.Get()
+            token = stream.Peek()
+
+        return token
+
+    def _firstSet(self) -> Optional[FrozenSet[Lexer.PatternID]]:
+        # The pattern IDs a successful parse can start with, or None if unknown and it must be tried
+        return None
+
+    def _withIgnores(self, firstSet: Optional[FrozenSet[Lexer.PatternID]]) -> Optional[FrozenSet[Lexer.PatternID]]:
+        return None if firstSet is None else firstSet | self.__ignores
+
     @abstractmethod
     def _parse(self, start: Position, stream: TokenStream) -> Result:
         raise NotImplementedError()
 
     def parse(self, stream: TokenStream) -> Result:
         startOffset = stream.GetOffset()
+        memoKey = (id(self), startOffset) if stream.IsMemoizing() else None
+
+        # Packrat memoization (opt-in): a parser re-run at the same token offset replays its outcome
+        if memoKey is not None:
+            memo = stream.Recall(memoKey)
+
+            if isinstance(memo, Parser.Error):
+                raise memo.with_traceback(None)
+            elif memo is not None:
+                result, endOffset = memo
+                stream.SetOffset(endOffset)
+                return result
 
         try:
-            while stream.Peek().patternID in self.__ignores:
-                stream.Get()
+            result = self._parse(self._skipIgnores(stream).position, stream)
+            result = Parser.Result(result.position, self.__transformer(result.value))
+            if memoKey is not None:
+                stream.Memoize(memoKey, (result, stream.GetOffset()))
 
-            result = self._parse(stream.GetPosition(), stream)
-            return Parser.Result(result.position, self.__transformer(result.value))
+            return result
         except Parser.Error as e:
             stream.SetOffset(startOffset)
-            raise Parser.Error.Combine(Parser.Error(stream.GetPosition(), f"Unable to parse {self.GetName()}"), e)
+            error = Parser.Error.Combine(Parser.Error(stream.GetPosition(), f"Unable to parse {self.GetName()}"), e)
+            if memoKey is not None:
+                stream.Memoize(memoKey, error)
+
+            raise error
 
     class Error(Exception):
-        def __init__(self, position: Position, msg: str) -> None:
+        # A combined error holds its (error1, error2) pair and only formats the message when printed
+        def __init__(self, position: Position, msg: Union[str, Tuple['Parser.Error', 'Parser.Error']]) -> None:
             super().__init__(position, msg)
 
         def __str__(self) -> str:
-            return f"Error @ {self.args[0]}: {self.args[1]}"
+            return f"Error @ {self.args[0]}: {self.GetMessage()}"
+
+        def GetMessage(self) -> str:
+            if isinstance(self.args[1], str):
+                return self.args[1]
+
+            error1, error2 = self.args[1]
+            return f"{error1.GetMessage()}\n{error2}"
 
         def Combine(error1: 'Parser.Error', error2: 'Parser.Error') -> 'Parser.Error':
-            return Parser.Error(error1.args[0], f"{error1.args[1]}\n{error2}")
+            return Parser.Error(error1.args[0], (error1, error2))
 
         def Expectation(expected: str, found: str, pos: Position) -> 'Parser.Error':
             return Parser.Error(pos, f"Expected {expected}, but found {found}")
 
 class Terminal(Parser):
+    __slots__ = ('__patternID', '__value')
+
     def __init__(self, name: str, patternID: Lexer.PatternID, value: Optional[str] = None, transformer: Optional[Parser.Transformer] = None, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
         super().__init__(name=name, transformer=transformer, ignores=ignores)
         self.__patternID = patternID
         self.__value = value
 
+    def _firstSet(self) -> Optional[FrozenSet[Lexer.PatternID]]:
+        return self._withIgnores(frozenset([self.__patternID]))
+
     def _parse(self, start: Position, stream: TokenStream) -> Parser.Result:
         token = stream.Get()
         
@@ -238,10 +351,18 @@ class Terminal(Parser):
         return Parser.Result(token.position, token.value)
 
 class Sequence(Parser):
+    __slots__ = ('__parsers',)
+
     def __init__(self, name: str, parsers: List[Parser], transformer: Optional[Parser.Transformer] = None, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
         super().__init__(name=name, transformer=transformer, ignores=ignores)
         self.__parsers = parsers
 
+    def _getParsers(self) -> List[Parser]:
+        return self.__parsers
+
+    def _firstSet(self) -> Optional[FrozenSet[Lexer.PatternID]]:
+        return self._withIgnores(self.__parsers[0]._firstSet()) if len(self.__parsers) != 0 else None
+
     def _parse(self, start: Position, stream: TokenStream) -> Parser.Result:
         results : List[Parser.Result] = []
 
@@ -250,14 +371,59 @@ class Sequence(Parser):
 
         return Parser.Result(results[0].position if len(results) != 0 else start, results)
 
+    def Project(name: str, parsers: List[Parser], index: int, transformer: Optional[Parser.Transformer] = None, ignores: Optional[List[Lexer.PatternID]] = None) -> 'Sequence':
+        return _ProjectingSequence(name, parsers, index, transformer=transformer, ignores=ignores)
+
+class _ProjectingSequence(Sequence):
+    __slots__ = ('__index',)
+
+    def __init__(self, name: str, parsers: List[Parser], index: int, transformer: Optional[Parser.Transformer] = None, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
+        super().__init__(name=name, parsers=parsers, transformer=transformer, ignores=ignores)
+
+        assert 0 <= index < len(parsers), f"index={index} is out of range for {len(parsers)} parsers"
+
+        self.__index = index
+
+    def _parse(self, start: Position, stream: TokenStream) -> Parser.Result:
+        # Every parser consumes its tokens but only the projected child's result is kept
+        result : Optional[Parser.Result] = None
+
+        for i, parser in enumerate(self._getParsers()):
+            if i == self.__index:
+                result = parser.parse(stream)
+            else:
+                parser.parse(stream)
+
+        return cast(Parser.Result, result)
+
 class Choice(Parser):
+    __slots__ = ('__parsers', '__tag', '__firstSets')
+
     def __init__(self, name: str, parsers: List[Parser], tag: bool, transformer: Optional[Parser.Transformer] = None, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
         super().__init__(name=name, transformer=transformer, ignores=ignores)
         self.__parsers = parsers
         self.__tag = tag
+        self.__firstSets : Optional[List[Optional[FrozenSet[Lexer.PatternID]]]] = None
+
+    def __GetFirstSets(self) -> List[Optional[FrozenSet[Lexer.PatternID]]]:
+        # Computed on first use so that Lazy parsers have been defined by then, and recomputed
+        # if alternatives were appended to the (caller-owned) parsers list since
+        if self.__firstSets is None or len(self.__firstSets) != len(self.__parsers):
+            self.__firstSets = [parser._firstSet() for parser in self.__parsers]
+
+        return self.__firstSets
+
+    def _firstSet(self) -> Optional[FrozenSet[Lexer.PatternID]]:
+        firstSets = self.__GetFirstSets()
+        return None if None in firstSets else self._withIgnores(frozenset().union(*firstSets))
 
     def _parse(self, start: Position, stream: TokenStream) -> Parser.Result:
-        for parser in self.__parsers:
+        patternID = stream.Peek().patternID
+
+        for parser, firstSet in zip(self.__parsers, self.__GetFirstSets()):
+            if firstSet is not None and patternID not in firstSet:
+                continue
+
             try:
                 result = parser.parse(stream)
                 return Parser.Result(result.position, (parser.GetName(), result.value)) if self.__tag else result
@@ -267,6 +433,8 @@ class Choice(Parser):
         raise Parser.Error(start, f"Expected one of [{', '.join([parser.GetName() for parser in self.__parsers])}]")
 
 class Quantified(Parser):
+    __slots__ = ('__parser', '__minimum', '__maximum')
+
     def __init__(self, name: str, parser: Parser, minimum: int = 0, maximum: Optional[int] = None, transformer: Optional[Parser.Transformer] = None, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
         super().__init__(name=name, transformer=transformer, ignores=ignores)
 
@@ -277,6 +445,9 @@ class Quantified(Parser):
         self.__minimum = minimum
         self.__maximum = maximum
 
+    def _firstSet(self) -> Optional[FrozenSet[Lexer.PatternID]]:
+        return self._withIgnores(self.__parser._firstSet()) if self.__minimum > 0 else None
+
     def _parse(self, start: Position,  stream: TokenStream) -> Parser.Result:
         results : List[Parser.Result] = []
 
@@ -302,37 +473,68 @@ class Quantified(Parser):
         return Quantified(name, parser, minimum=0, maximum=None, transformer=transformer, ignores=ignores)
 
 class Separated(Parser):
+    __slots__ = ('__value', '__seperator')
+
     def __init__(self, name: str, value: Parser, seperator: Parser, transformer: Optional[Parser.Transformer] = None, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
         super().__init__(name=name, transformer=transformer, ignores=ignores)
 
-        appendage = Sequence(name, [seperator, value], transformer=lambda result: result[1], ignores=ignores)
-        tail = Quantified.AtLeast0(name, appendage, transformer=lambda result: [res.value for res in result], ignores=ignores)
-        self.__parser = Sequence(name, [value, tail], transformer=lambda result: [result[0]] + result[1].value, ignores=ignores)
+        self.__value = value
+        self.__seperator = seperator
 
     def _parse(self, start: Position, stream: TokenStream) -> Parser.Result:
         try:
-            return self.__parser.parse(stream)
+            results = [self.__value.parse(stream)]
         except Parser.Error:
             return Parser.Result(start, [])
 
+        while True:
+            offset = stream.GetOffset()
+
+            try:
+                self._skipIgnores(stream)
+                self.__seperator.parse(stream)
+                results.append(self.__value.parse(stream))
+            except Parser.Error:
+                stream.SetOffset(offset)
+                break
+
+        return Parser.Result(results[0].position, results)
+
 class Lazy(Parser):
+    __slots__ = ('__thunk', '__resolved')
+
     def __init__(self, name: str, thunk: Callable[[], Parser]) -> None:
         super().__init__(name=name)
         self.__thunk = thunk
+        self.__resolved : Optional[Parser] = None
+
+    def __Resolve(self) -> Parser:
+        parser = self.__resolved
+
+        if parser is None:
+            parser = self.__resolved = self.__thunk()
+
+        return parser
         
     def _parse(self, start: Position, stream: TokenStream) -> Parser.Result:
         assert False, "Should not be called. self.__thunk().parse() should override self.parse()"
 
+    def _firstSet(self) -> Optional[FrozenSet[Lexer.PatternID]]:
+        return self.__Resolve()._firstSet()
+
     def parse(self, stream: TokenStream) -> Parser.Result:
-        return self.__thunk().parse(stream)
+        return self.__Resolve().parse(stream)
 
 T = TypeVar('T')
 class LPC(Generic[T]):
-    def __init__(self, lexer: Lexer, parser: Parser, ignores: Optional[List[Lexer.PatternID]] = None) -> None:
+    __slots__ = ('__lexer', '__parser', '__ignores', '__memoRate')
+
+    def __init__(self, lexer: Lexer, parser: Parser, ignores: Optional[List[Lexer.PatternID]] = None, memoRate: float = 0.0) -> None:
         self.__lexer = lexer
         self.__parser = parser
         self.__ignores = ignores if ignores is not None else []
+        self.__memoRate = memoRate
 
     def parse(self, text: str) -> T:
-        stream = TokenStream(self.__lexer, text, self.__ignores)
+        stream = TokenStream(self.__lexer, text, self.__ignores, self.__memoRate)
         return cast(T, self.__parser.parse(stream).value)
\ No newline at end of file
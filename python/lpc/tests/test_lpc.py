@@ -1,3 +1,5 @@
+import pytest
+from typing import List
 from lpc import __version__
 from lpc import lpc
 
@@ -24,4 +26,130 @@ def test_json():
         parse_result = parser.parse(test_str)
         assert test == parse_result
     except lpc.Parser.Error as e:
-        print(e)
\ No newline at end of file
+        print(e)
+
+def test_string_stream_position():
+    stream = lpc.StringStream("ab\ncd\n\nx")
+    expected = [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (2, 3), (3, 1), (4, 1), (4, 2)]
+
+    for offset, (line, column) in enumerate(expected):
+        stream.SetOffset(offset)
+        assert stream.GetPosition() == lpc.Position(line, column)
+
+    # A trailing newline starts a new (empty) final line
+    stream = lpc.StringStream("a\n")
+    expected = [(1, 1), (1, 2), (2, 1)]
+
+    for offset, (line, column) in enumerate(expected):
+        stream.SetOffset(offset)
+        assert stream.GetPosition() == lpc.Position(line, column)
+
+    stream.SetOffset(0)
+    stream.SetPosition(lpc.Position(2, 1))
+    assert stream.IsEOS()
+
+def test_json_escapes():
+    from examples import json_parser
+
+    assert json_parser.JSONParser().parse('["\\\\n", "a\\\\\\"b", "\\\\q"]') == ["\\n", "a\\\"b", "\\q"]
+
+def test_sequence_project():
+    lexer = lpc.Lexer()
+    lexer.AddPattern("\\(|\\)", None, "PAREN")
+    lexer.AddPattern("[a-z]+", None, "WORD")
+
+    parser = lpc.Sequence.Project("group", [lpc.Terminal("(", "PAREN", "("), lpc.Terminal("word", "WORD"), lpc.Terminal(")", "PAREN", ")")], 1)
+    result = parser.parse(lpc.TokenStream(lexer, "(abc)"))
+
+    assert result.value == "abc"
+    assert result.position == lpc.Position(1, 2)
+
+def test_json_numbers():
+    from examples import json_parser
+
+    result = json_parser.JSONParser().parse("[0, -12, 1.5, 2e3, -4.25E-2]")
+    assert result == [0, -12, 1.5, 2e3, -4.25e-2]
+    assert [type(value) for value in result] == [int, int, float, float, float]
+
+def test_memoized_backtracking():
+    lexer = lpc.Lexer()
+    lexer.AddPattern("[a-z]", None, "LETTER")
+
+    calls = []
+    prefix = lpc.Terminal("a", "LETTER", "a", transformer=lambda value: calls.append(value) or value)
+    parser = lpc.Choice("choice", [
+        lpc.Sequence("ab", [prefix, lpc.Terminal("b", "LETTER", "b")]),
+        lpc.Sequence("ac", [prefix, lpc.Terminal("c", "LETTER", "c")]),
+    ], tag=True)
+
+    for memoRate, expectedCalls in [(0.0, 2), (1.0, 1)]:
+        calls.clear()
+        stream = lpc.TokenStream(lexer, "acd", memoRate=memoRate)
+        result = parser.parse(stream)
+
+        assert result.value[0] == "ac"
+        assert [res.value for res in result.value[1]] == ["a", "c"]
+        assert len(calls) == expectedCalls
+        assert stream.Peek().value == "d"
+
+def test_lexer_patterns_with_groups():
+    lexer = lpc.Lexer()
+    lexer.AddPattern("(?P<q>a+)", None, "A")
+    lexer.AddPattern("(?P<q>b+)", None, "B")
+    lexer.AddPattern("(c)\\2", None, "CC")
+
+    stream = lpc.StringStream("aabcc")
+    tokens = [lexer.Lex(stream) for _ in range(4)]
+
+    assert [(token.patternID, token.value) for token in tokens] == [("A", "aa"), ("B", "b"), ("CC", "cc"), (lpc.Lexer.EOS_PATTERN_ID, "")]
+
+def test_choice_first_sets():
+    lexer = lpc.Lexer()
+    lexer.AddPattern("\\s+", None, "WS")
+    lexer.AddPattern("a", None, "A")
+    lexer.AddPattern("b", None, "B")
+
+    # The next token is WS, which only the second alternative's own ignores admit
+    ignoring = lpc.Choice("choice", [lpc.Terminal("a", "A"), lpc.Terminal("b", "B", ignores=["WS"])], tag=True)
+    assert ignoring.parse(lpc.TokenStream(lexer, " b")).value == ("b", "b")
+
+    # An alternative without a known FIRST set is always tried
+    unknown = lpc.Quantified.AtLeast0("bs", lpc.Terminal("b", "B"))
+    assert unknown._firstSet() is None
+
+    choice = lpc.Choice("choice", [lpc.Terminal("a", "A"), unknown], tag=True)
+    result = choice.parse(lpc.TokenStream(lexer, "bb"))
+    assert result.value[0] == "bs"
+    assert [res.value for res in result.value[1]] == ["b", "b"]
+
+def test_memo_sampling_keeps_global_random_state():
+    import random
+    from examples import json_parser
+
+    random.seed(5)
+    expected = random.random()
+
+    random.seed(5)
+    assert lpc.LPC(json_parser._JSON_LEXER, json_parser._JSON_ROOT, ["WS"], memoRate=0.5).parse("[1, [2, {}], 3]") == [1, [2, {}], 3]
+    assert random.random() == expected
+
+def test_choice_pruning_keeps_winner():
+    lexer = lpc.Lexer()
+    lexer.AddPattern("a", None, "A")
+    lexer.AddPattern("b", None, "B")
+
+    # The first alternative cannot start with B and would raise if tried; the second still wins
+    pruned = lpc.Sequence("ab", [lpc.Terminal("a", "A"), lpc.Terminal("b", "B")])
+    with pytest.raises(lpc.Parser.Error):
+        pruned.parse(lpc.TokenStream(lexer, "b"))
+
+    parsers: List[lpc.Parser] = [pruned, lpc.Terminal("b", "B")]
+    choice = lpc.Choice("choice", parsers, tag=True)
+    assert choice.parse(lpc.TokenStream(lexer, "b")).value == ("b", "b")
+
+    # Alternatives appended after the first parse are still tried
+    with pytest.raises(lpc.Parser.Error):
+        choice.parse(lpc.TokenStream(lexer, "a"))
+
+    parsers.append(lpc.Terminal("a", "A"))
+    assert choice.parse(lpc.TokenStream(lexer, "a")).value == ("a", "a")